@@ -1,6 +1,6 @@
 # coding: utf-8
 
-__version__ = "0.10.3"
+__version__ = "0.11.0"
 
 import gettext
 import os
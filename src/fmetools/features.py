@@ -220,8 +220,10 @@ def set_list_attribute_with_properties(
         then the null value will be set with :data:`fmeobjects.FME_ATTR_STRING`.
     """
     attr_types = attr_types or {}
+    # The index part is the same for every property, so only format it once.
+    list_index = "{%s}" % index
     for attr_name, value in property_attrs.items():
         if "{}" not in attr_name:
             raise ValueError(tr("List attribute name missing '{}'"))
-        final_attr_name = attr_name.replace("{}", "{%s}" % index, 1)
+        final_attr_name = attr_name.replace("{}", list_index, 1)
         set_attribute(feature, final_attr_name, value, attr_types.get(attr_name))
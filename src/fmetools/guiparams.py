@@ -17,9 +17,10 @@ from __future__ import annotations
 from collections import namedtuple
 from typing import Any, Mapping, Union
 
-from fmeobjects import FMEFeature, FMESession
+from fmeobjects import FMEFeature
 
 from .features import get_attribute
+from .utils import FMEDecoder
 
 # This is the only class relevant externally.
 __all__ = ["GuiParameterParser"]
@@ -30,10 +31,11 @@ class ParameterParser:
         self.or_attr = or_attr
         self.encoded = encoded
         self.config = config
+        self._decode = FMEDecoder()
 
     def __call__(self, value: Union[bool, int, float, str]):
         if isinstance(value, str) and self.encoded:
-            return FMESession().decodeFromFMEParsableText(value)
+            return self._decode(value)
         return value
 
 
@@ -77,7 +79,7 @@ class FMEParsableStringParser(ParameterParser):
         value = super().__call__(value)
         if not isinstance(value, str):
             return str(value)
-        return FMESession().decodeFromFMEParsableText(value)
+        return self._decode(value)
 
 
 class ListParser(ParameterParser):
@@ -91,8 +93,7 @@ class ListParser(ParameterParser):
         value = super().__call__(value)
         if not isinstance(value, str):
             return [str(value)]
-        s = FMESession()
-        items = list(map(s.decodeFromFMEParsableText, value.split()))
+        items = list(map(self._decode, value.split()))
         if items == [""]:
             return []
         return items
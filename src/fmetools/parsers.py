@@ -4,19 +4,21 @@ This module contains parsers to support FME reader/writer development.
 It is not intended for general use.
 """
 
-from collections import OrderedDict, namedtuple
+import functools
+import sys
+from collections import namedtuple
 
 import fme
-import six
 from fmeobjects import FMEFeature, FMESession  # noqa F401
 from pluginbuilder import FMEMappingFile  # noqa F401
-from six import string_types
 
-from .utils import string_to_bool
+from .utils import FMEDecoder, string_to_bool
 
 # Nothing here is intended for general use.
 __all__ = []
 
+_MISSING = object()
+
 
 def _system_to_unicode(original):
     """Try to convert a system-encoded string to a Unicode string. Characters
@@ -25,12 +27,15 @@ def _system_to_unicode(original):
     :type original: str
     :param original: System encoded string to convert.
     :return: The converted string.
-    :rtype: six.text_type
+    :rtype: str
     """
     # See PRs #52906-52909.
-    if isinstance(original, six.text_type):
+    if isinstance(original, str):
         # If input is already a Unicode string, return it as-is.
         return original
+    if original.isascii():
+        # ASCII decodes the same under any system encoding, and has a fast path.
+        return original.decode("ascii")
     return original.decode(fme.systemEncoding, "replace")
 
 
@@ -42,26 +47,29 @@ def stringarray_to_dict(stringarray, start=0):
     Given a list `stringarray`,
     convert elements `start+(2*n)` to keys, and `start+n` to values.
     Duplicate keys cause the corresponding values to be collected into a list.
+    Keys are interned, as the same few names recur across DEF lines and parameters.
 
     :param list stringarray: Must have an even number of elements starting from `start`
     :param int start: Start index
-    :rtype: OrderedDict
+    :rtype: dict
     """
     assert (len(stringarray) - start) % 2 == 0
-    result = OrderedDict()
-    for index in range(start, len(stringarray), 2):
-        key = _system_to_unicode(stringarray[index])
-        value = _system_to_unicode(stringarray[index + 1])
-        if key in result:
-            if not isinstance(result[key], list):
-                result[key] = [result[key]]
-            result[key].append(value)
-        else:
+    result = {}
+    for key, value in zip(
+        map(sys.intern, map(_system_to_unicode, stringarray[start::2])),
+        map(_system_to_unicode, stringarray[start + 1 :: 2]),
+    ):
+        existing = result.get(key, _MISSING)
+        if existing is _MISSING:
             result[key] = value
+        elif isinstance(existing, list):
+            existing.append(value)
+        else:
+            result[key] = [existing, value]
     return result
 
 
-class OpenParameters(OrderedDict):
+class OpenParameters(dict):
     """
     Provides convenient access to the open() parameters given to
     :meth:`FMEReader.open` and :meth:`FMEWriter.open`.
@@ -87,10 +95,10 @@ class OpenParameters(OrderedDict):
         assert (len(parameters) > 0 and len(parameters) % 2 == 1) or not len(parameters)
         super(OpenParameters, self).__init__()
 
-        self.__session = FMESession()
+        self.__decode = FMEDecoder()
 
         # If open() parameters aren't empty, the first element is the dataset.
-        self.dataset = self.__session.decodeFromFMEParsableText(dataset)
+        self.dataset = self.__decode(dataset)
 
         self.original = parameters
         if len(parameters) >= 3:
@@ -106,8 +114,8 @@ class OpenParameters(OrderedDict):
         :rtype: str
         """
         value = super(OpenParameters, self).get(key, default)
-        if decode and isinstance(value, string_types):
-            value = self.__session.decodeFromFMEParsableText(value)
+        if decode and isinstance(value, str):
+            value = self.__decode(value)
         return value
 
     def get_flag(self, key, default=False):
@@ -144,18 +152,42 @@ def parse_def_line(def_line, option_names):
     :return: Tuple of:
 
         - Feature type
-        - OrderedDict of attributes and their types
+        - dict of attributes and their types, in DEF line order
         - dict of options and their values, FME-decoded.
           All `option_names` are guaranteed to be keys in this dict,
           with a value of `None` if the option wasn't present on the DEF line.
     :rtype: DefLine
     """
+    # At most one session for the whole DEF line. It can't outlive the call.
+    return _parse_def_line(FMEDecoder(), def_line, option_names)
+
+
+def parse_many_def_lines(def_lines, option_names):
+    """
+    Like :func:`parse_def_line`, but parses a batch of DEF lines,
+    such as those from :meth:`MappingFile.def_lines`,
+    using at most one :class:`FMESession` for all of them.
+
+    :param def_lines: The DEF lines. Each must have an even number of elements.
+    :type def_lines: Iterable[list[str]]
+    :param set option_names: If a key matches one of these names,
+        it'll be separated from the attributes.
+    :return: Parsed DEF lines, in the same order.
+    :rtype: list[DefLine]
+    """
+    # A list rather than a generator, so the session can't outlive the call.
+    fme_decode = FMEDecoder()
+    return [_parse_def_line(fme_decode, line, option_names) for line in def_lines]
+
+
+def _parse_def_line(fme_decode, def_line, option_names):
+    """Implementation of :func:`parse_def_line` using the given decoder."""
     assert len(def_line) % 2 == 0
 
     def decode(v):
         if isinstance(v, list):
-            return [decode(x) for x in v]
-        return v if v is None else FMESession().decodeFromFMEParsableText(v)
+            return [fme_decode(x) for x in v]
+        return v if v is None else fme_decode(v)
 
     attributes = stringarray_to_dict(def_line, start=2)
     options = {option: decode(attributes.pop(option, None)) for option in option_names}
@@ -192,6 +224,11 @@ class MappingFile:
     mapping file for the same directive.
     Instead, the mapping file can be used exclusively.
 
+    DEF lines and directive values are cached after they're first read.
+    Call :meth:`invalidate` whenever the mapping file may have changed,
+    such as at the start of each reader/writer `open()`,
+    or else stale values will be returned for the life of this object.
+
     :ivar FMEMappingFile mapping_file: The original mapping file object.
     """
 
@@ -204,26 +241,47 @@ class MappingFile:
         self.mapping_file = mapping_file
         self._plugin_keyword = plugin_keyword
         self._plugin_type = plugin_type
+        self._def_filter = plugin_keyword + "_DEF"
+
+        self.__decode = FMEDecoder()
+        self._def_lines = None
+        self._fetched = {}
+
+    def invalidate(self):
+        """Discard DEF lines and directive values read from the mapping file,
+        so they're read again on next use.
 
-        self.__session = FMESession()
+        Call this when the mapping file may have changed,
+        such as at the start of each reader/writer `open()`.
+        """
+        self._def_lines = None
+        self._fetched.clear()
 
     def def_lines(self):
         """Get an iterable over DEF lines for this plugin.
 
+        DEF lines are read from the mapping file on the first call
+        and reused afterwards, until :meth:`invalidate` is called.
+        Each call yields fresh copies, so callers may modify the lines they get.
+
         :return: iterator
         """
-        def_filter = self._plugin_keyword + "_DEF"
-        self.mapping_file.startIteration()
-        def_line_buffer = self.mapping_file.nextLineWithFilter(def_filter)
-        while def_line_buffer is not None:
-            yield def_line_buffer
-            def_line_buffer = self.mapping_file.nextLineWithFilter(def_filter)
+        if self._def_lines is None:
+            next_line = functools.partial(
+                self.mapping_file.nextLineWithFilter, self._def_filter
+            )
+            self.mapping_file.startIteration()
+            self._def_lines = list(iter(next_line, None))
+        return map(list, self._def_lines)
 
     def fetch_with_prefix(self, plugin_keyword, plugin_type, directive):
         """Like :meth:`FMEMappingFile.fetchWithPrefix`, but also handles the
         Python-specific situation where directive values are returned as
         2-element lists with identical values.
 
+        Values are only fetched from the mapping file once per directive,
+        until :meth:`invalidate` is called.
+
         :param str plugin_keyword: Plugin keyword string.
         :param str plugin_type: Plugin type string.
         :param str directive: Name of the directive.
@@ -231,11 +289,18 @@ class MappingFile:
             return the element. Otherwise, the list is returned as-is.
         :rtype: str
         """
-        value = self.mapping_file.fetchWithPrefix(
-            plugin_keyword, plugin_type, directive
-        )
-        if isinstance(value, list) and len(value) == 2 and value[0] == value[1]:
-            return value[0]
+        key = (plugin_keyword, plugin_type, directive)
+        value = self._fetched.get(key, _MISSING)
+        if value is _MISSING:
+            value = self.mapping_file.fetchWithPrefix(
+                plugin_keyword, plugin_type, directive
+            )
+            if isinstance(value, list) and len(value) == 2 and value[0] == value[1]:
+                value = value[0]
+            self._fetched[key] = value
+        if isinstance(value, list):
+            # Callers get their own copy, so the cached value can't be modified.
+            return list(value)
         return value
 
     def get(self, directive, default=None, decode=True, as_list=False):
@@ -255,14 +320,14 @@ class MappingFile:
         )
         if value is None:
             return default
-        if as_list and isinstance(value, six.string_types):
-            value = value.split()
+        if as_list and isinstance(value, str):
+            entries = value.split()
+            # Entries are decoded individually, as decoding could introduce spaces.
             if decode:
-                value = [
-                    self.__session.decodeFromFMEParsableText(entry) for entry in value
-                ]
-        elif decode and isinstance(value, six.string_types):
-            value = self.__session.decodeFromFMEParsableText(value)
+                entries = [self.__decode(entry) for entry in entries]
+            value = entries
+        elif decode and isinstance(value, str):
+            value = self.__decode(value)
         return value
 
     def get_flag(self, directive, default=False):
@@ -303,9 +368,9 @@ class MappingFile:
         featTypes = self.mapping_file.fetchFeatureTypes(
             self._plugin_keyword, self._plugin_type, open_parameters, fetch_mode
         )
-        if featTypes is None:
+        if not featTypes:
             # Mapping file returns None when there are no feature types,
             # but that requires a separate check for None in code that uses it.
             # Eliminate this distinction.
             return []
-        return [_system_to_unicode(ft) for ft in featTypes]
+        return list(map(_system_to_unicode, featTypes))
@@ -11,7 +11,7 @@ from __future__ import annotations
 
 import logging
 import warnings
-from typing import Optional, Generator
+from typing import Optional, Generator, Iterator
 
 try:
     from fme import BaseTransformer as FMEBaseTransformer
@@ -105,7 +105,11 @@ class FMESimplifiedReader(FMEReader):
         """
         if new_debug != self._debug:
             self._debug = new_debug
-            self._log = get_configured_logger(self.__class__.__name__, self._debug)
+            # A logger that's already built is reconfigured right away,
+            # as callers may hold a reference to it.
+            # Otherwise, it's built with the new setting when it's first used.
+            if self._log:
+                self._log = get_configured_logger(self.__class__.__name__, self._debug)
 
     def hasSupportFor(self, support_type) -> bool:
         """
@@ -130,6 +134,7 @@ class FMESimplifiedReader(FMEReader):
 
         Does these things for you:
 
+        * Discards mapping file values cached from any previous open().
         * Parses the open() parameters.
         * Checks for the debug flag in open() parameters.
         * Calls :meth:`enhancedOpen`.
@@ -140,6 +145,7 @@ class FMESimplifiedReader(FMEReader):
         :param str dataset_name: Name of the dataset.
         :param list[str] parameters: List of parameters.
         """
+        self._mapping_file.invalidate()
 
         # If not using setConstraints(), then get some basics from the mapping file.
         if not self._using_constraints:
@@ -148,7 +154,7 @@ class FMESimplifiedReader(FMEReader):
         # Look for the debug flag in the open() parameters.
         open_parameters = OpenParameters(dataset_name, parameters)
         if open_parameters.get("FME_DEBUG"):
-            self._debug = True
+            self.debug = True
 
         self._list_feature_types = self._mapping_file.get_flag(
             "RETRIEVE_ALL_TABLE_NAMES"
@@ -224,19 +230,14 @@ class FMESimplifiedReader(FMEReader):
         except StopIteration:
             return None
 
-    def readSchemaGenerator(self) -> Generator[FMEFeature]:
+    def readSchemaGenerator(self) -> Iterator[FMEFeature]:
         """
-        Generator form of :meth:`readSchema`.
+        Iterator form of :meth:`readSchema`, which ends when it returns `None`.
 
         Simplifies some logic in tests by eliminating the need to
         check whether the return value is `None`.
         """
-        while True:
-            feature = self.readSchema()
-            if feature:
-                yield feature
-            else:
-                break
+        return iter(self.readSchema, None)
 
     def _read_features_generator(self) -> Generator[FMEFeature]:
         """
@@ -262,19 +263,14 @@ class FMESimplifiedReader(FMEReader):
         except StopIteration:
             return None
 
-    def readGenerator(self) -> Generator[FMEFeature]:
+    def readGenerator(self) -> Iterator[FMEFeature]:
         """
-        Generator form of :meth:`read`.
+        Iterator form of :meth:`read`, which ends when it returns `None`.
 
         Simplifies some logic in tests by eliminating the need to
         check whether the return value is `None`.
         """
-        while True:
-            feature = self.read()
-            if feature:
-                yield feature
-            else:
-                break
+        return iter(self.read, None)
 
     def abort(self) -> None:
         self._aborted = True
@@ -288,10 +284,16 @@ class FMESimplifiedReader(FMEReader):
         # or else FMESession may leak and cause warnings.
         # This can happen during a runtime error that causes abort() to be called,
         # or if Features to Read was set in the workspace, which limits read() calls.
-        if self._readSchema_generator:
-            self._readSchema_generator.close()
-        if self._read_generator:
-            self._read_generator.close()
+        # Clearing the references makes redundant calls a no-op.
+        # The read generator is closed even if closing the schema one raises.
+        try:
+            generator, self._readSchema_generator = self._readSchema_generator, None
+            if generator is not None:
+                generator.close()
+        finally:
+            generator, self._read_generator = self._read_generator, None
+            if generator is not None:
+                generator.close()
 
     def __enter__(self):
         return self
@@ -353,13 +355,18 @@ class FMESimplifiedWriter(FMEWriter):
         """
         if new_debug != self._debug:
             self._debug = new_debug
-            self._log = get_configured_logger(self.__class__.__name__, self._debug)
+            # A logger that's already built is reconfigured right away,
+            # as callers may hold a reference to it.
+            # Otherwise, it's built with the new setting when it's first used.
+            if self._log:
+                self._log = get_configured_logger(self.__class__.__name__, self._debug)
 
     def open(self, dataset, parameters):
         """Open the dataset for writing.
 
         Does these things for you:
 
+        * Discards mapping file values cached from any previous open().
         * Sets `_feature_types` using the mapping file and/or open parameters.
         * Parses the open() parameters.
         * Checks for the debug flag in open() parameters,
@@ -369,6 +376,7 @@ class FMESimplifiedWriter(FMEWriter):
         :param str dataset: Dataset value, such as a file path or URL.
         :param list[str] parameters: List of parameters.
         """
+        self._mapping_file.invalidate()
 
         self._feature_types = self._mapping_file.get_feature_types(parameters)
 
@@ -464,6 +472,7 @@ class FMEEnhancedTransformer(FMEBaseTransformer):
     def __init__(self):
         super(FMEEnhancedTransformer, self).__init__()
         self._initialized = False
+        self._hooks_are_noops = False
         self._initialized_tags = set()
         self._log = None
 
@@ -498,6 +507,13 @@ class FMEEnhancedTransformer(FMEBaseTransformer):
         if not self._initialized:
             self.setup(feature)
             self._initialized = True
+            # Hooks are resolved through the instance,
+            # so ones assigned on it (e.g. in setup()) count as overrides.
+            self._hooks_are_noops = all(
+                getattr(getattr(self, name), "__func__", None)
+                is getattr(FMEEnhancedTransformer, name)
+                for name in ("pre_input", "post_input")
+            )
 
     def receive_feature(self, feature: FMEFeature) -> None:
         """
@@ -514,6 +530,10 @@ class FMEEnhancedTransformer(FMEBaseTransformer):
 
     def input(self, feature: FMEFeature) -> None:
         """Do not override this method."""
+        if self._hooks_are_noops:
+            # Setup is done and the other hooks do nothing.
+            self.receive_feature(feature)
+            return
         self.pre_input(feature)
         self.receive_feature(feature)
         self.post_input(feature)
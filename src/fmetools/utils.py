@@ -3,6 +3,8 @@
 Miscellaneous utilities.
 """
 
+from fmeobjects import FMESession
+
 # Nothing here is intended for general use.
 __all__ = []
 
@@ -42,3 +44,28 @@ def string_to_bool(string):
         return bool(float(string))
     except (TypeError, ValueError):
         return None
+
+
+class FMEDecoder:
+    """FME-decodes values, creating an :class:`FMESession` only once one is needed.
+
+    FME-parsable text escapes special characters as ``<name>`` sequences,
+    so strings without ``<`` are returned as-is without calling into FME.
+    Most values have nothing to decode, so a session is often never created.
+    """
+
+    __slots__ = ("_session",)
+
+    def __init__(self):
+        self._session = None
+
+    def __call__(self, value):
+        """
+        :param str value: FME-encoded value.
+        :rtype: str
+        """
+        if isinstance(value, str) and "<" not in value:
+            return value
+        if self._session is None:
+            self._session = FMESession()
+        return self._session.decodeFromFMEParsableText(value)
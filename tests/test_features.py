@@ -134,3 +134,6 @@ def test_set_list_attribute_with_properties():
     set_list_attribute_with_properties(f, 10, props)
     assert get_attribute(f, "foo{10}.bar")
     assert get_attribute(f, "foo{10}.baz")
+    # Non-int indexes are formatted as-is.
+    set_list_attribute_with_properties(f, "2", {"foo{}.bar": 1})
+    assert get_attribute(f, "foo{2}.bar")
@@ -1,4 +1,5 @@
 import re
+from unittest.mock import patch
 
 import pytest
 from fmeobjects import FMEFeature
@@ -109,6 +110,16 @@ def test_listparser(value):
         assert len(parsed) == len(value.split())
 
 
+def test_parser_reuses_session():
+    with patch("fmetools.utils.FMESession") as session:
+        session.return_value.decodeFromFMEParsableText.side_effect = ["a b", "c d"]
+        parser = ListParser()
+        assert parser("plain list") == ["plain", "list"]
+        session.assert_not_called()
+        assert parser("a<space>b c<space>d") == ["a b", "c d"]
+        session.assert_called_once()
+
+
 def test_parser():
     parser = GuiParameterParser({"ATTR1": "STRING_ENCODED", "ATTR2": "INTEGER"})
     feature = FMEFeature()
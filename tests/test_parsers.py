@@ -1,11 +1,20 @@
 # coding: utf-8
 
 from collections import Counter
+from unittest.mock import Mock, patch
 
 from hypothesis import given, assume, example, settings
 from hypothesis.strategies import integers, text, lists
 
-from fmetools.parsers import stringarray_to_dict, parse_def_line
+import fme
+
+from fmetools.parsers import (
+    MappingFile,
+    _system_to_unicode,
+    stringarray_to_dict,
+    parse_def_line,
+    parse_many_def_lines,
+)
 
 
 @given(lists(text(), max_size=6), integers(min_value=0, max_value=6))
@@ -47,3 +56,84 @@ def test_parse_def_line(keys, num_matching_options):
         # Don't proceed if there are dupe user attrs.
         assume(Counter(expected_user_attrs).most_common()[0][1] == 1)
     assert list(parsed.attributes.keys()) == expected_user_attrs
+
+
+def test_parse_def_line_decodes_options():
+    line = ["DEF_1", "ft", "plain", "a_b", "enc", "a<space>b", "attr", "a<space>b"]
+    parsed = parse_def_line(line, {"plain", "enc"})
+    assert parsed.options == {"plain": "a_b", "enc": "a b"}
+    assert parsed.attributes == {"attr": "a<space>b"}  # attributes aren't decoded
+
+
+def test_parse_many_def_lines():
+    lines = [
+        ["DEF_1", "ft1", "a", "char(10)", "opt", "x<space>y"],
+        ["DEF_1", "ft2", "b", "int"],
+    ]
+    parsed = parse_many_def_lines(lines, {"opt"})
+    assert parsed == [parse_def_line(line, {"opt"}) for line in lines]
+    assert parsed[0].options == {"opt": "x y"}
+    assert parsed[1].attributes == {"b": "int"}
+
+
+def test_mapping_file_def_lines_read_once():
+    lines = [["K_DEF", "ft1"], ["K_DEF", "ft2"]]
+    mapping_file = Mock()
+    mapping_file.nextLineWithFilter.side_effect = lines + [None]
+    wrapper = MappingFile(mapping_file, "K", "T")
+    assert list(wrapper.def_lines()) == lines
+    next(wrapper.def_lines())[1] = "modified"
+    assert list(wrapper.def_lines()) == [["K_DEF", "ft1"], ["K_DEF", "ft2"]]
+    mapping_file.startIteration.assert_called_once()
+    mapping_file.nextLineWithFilter.assert_called_with("K_DEF")
+
+
+def test_mapping_file_fetches_directive_once():
+    mapping_file = Mock()
+    mapping_file.fetchWithPrefix.side_effect = [["a", "b"], None]
+    wrapper = MappingFile(mapping_file, "K", "T")
+    values = wrapper.get("LIST")
+    values.append("c")
+    assert wrapper.get("LIST") == ["a", "b"]
+    assert wrapper.get("MISSING", "default") == "default"
+    assert wrapper.get("MISSING") is None
+    assert mapping_file.fetchWithPrefix.call_count == 2
+
+
+def test_mapping_file_invalidate():
+    mapping_file = Mock()
+    mapping_file.fetchWithPrefix.side_effect = [None, "new"]
+    mapping_file.nextLineWithFilter.side_effect = [["K_DEF", "ft1"], None, None]
+    wrapper = MappingFile(mapping_file, "K", "T")
+    assert wrapper.get("DIRECTIVE") is None
+    assert list(wrapper.def_lines()) == [["K_DEF", "ft1"]]
+    wrapper.invalidate()
+    assert wrapper.get("DIRECTIVE") == "new"
+    assert list(wrapper.def_lines()) == []
+
+
+def test_mapping_file_creates_session_on_demand():
+    mapping_file = Mock()
+    mapping_file.fetchWithPrefix.side_effect = ["plain", "a<space>b", "c<space>d"]
+    with patch("fmetools.utils.FMESession") as session:
+        session.return_value.decodeFromFMEParsableText.side_effect = ["a b", "c d"]
+        wrapper = MappingFile(mapping_file, "K", "T")
+        assert wrapper.get("PLAIN") == "plain"
+        session.assert_not_called()
+        assert wrapper.get("ENCODED") == "a b"
+        assert wrapper.get("ENCODED_2") == "c d"
+        session.assert_called_once()
+
+
+def test_system_to_unicode(monkeypatch):
+    monkeypatch.setattr(fme, "systemEncoding", "utf-8")
+    assert _system_to_unicode("café") == "café"
+    assert _system_to_unicode(b"abc") == "abc"
+    assert _system_to_unicode(b"caf\xc3\xa9") == "café"
+    assert _system_to_unicode(b"caf\xe9") == "caf\ufffd"
+
+
+def test_system_to_unicode_ascii_ignores_system_encoding(monkeypatch):
+    # ASCII bytes aren't decoded with the system encoding at all.
+    monkeypatch.setattr(fme, "systemEncoding", "utf-16")
+    assert _system_to_unicode(b"abc") == "abc"
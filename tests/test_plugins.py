@@ -1,5 +1,8 @@
 # coding: utf-8
 
+import logging
+import weakref
+
 import fme
 from fmeobjects import FMEFeature
 
@@ -34,6 +37,47 @@ def test_reader():
         rdr.close()
 
 
+def test_reader_debug_from_open_parameters():
+    with patch("pluginbuilder.FMEMappingFile") as mf:
+        mf.fetch.return_value = None
+        rdr = MockReader("T", "K", mf)
+        log = rdr.log
+        assert not log.isEnabledFor(logging.DEBUG)
+        rdr.open("foobar", ["foobar", "FME_DEBUG", "YES"])
+        assert rdr.debug
+        assert log.isEnabledFor(logging.DEBUG)
+        assert rdr.log.isEnabledFor(logging.DEBUG)
+        rdr.close()
+
+
+def test_reader_reopen_refetches_directives():
+    with patch("pluginbuilder.FMEMappingFile") as mf, MockReader("T", "K", mf) as rdr:
+        rdr.open("foobar", [])
+        fetches = mf.fetchWithPrefix.call_count
+        rdr.open("foobar", [])
+        assert mf.fetchWithPrefix.call_count == 2 * fetches
+
+
+class GeneratorReader(FMESimplifiedReader):
+    def _read_features_generator(self):
+        for _ in range(3):
+            yield FMEFeature()
+
+
+def test_reader_close_releases_generators():
+    with patch("pluginbuilder.FMEMappingFile") as mf:
+        rdr = GeneratorReader("T", "K", mf)
+        rdr.open("foobar", [])
+        assert len(list(rdr.readGenerator())) == 3
+        rdr.setConstraints(FMEFeature())
+        assert rdr.read() is not None
+        generator = rdr._read_generator
+        rdr.close()
+        assert generator.gi_frame is None  # Closed.
+        assert rdr._read_generator is None
+        rdr.close()
+
+
 class MockWriter(FMESimplifiedWriter):
     def multiFileWriter(self):
         return False
@@ -70,6 +114,57 @@ def test_enhanced_transformer():
         xformer.close()
 
 
+class CountingTransformer(FMEEnhancedTransformer):
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def setup(self, first_feature):
+        self.calls.append("setup")
+
+    def receive_feature(self, feature):
+        self.calls.append("receive")
+
+
+class CountingPostInputTransformer(CountingTransformer):
+    def post_input(self, feature):
+        self.calls.append("post")
+
+
+class InstanceHookTransformer(CountingTransformer):
+    def setup(self, first_feature):
+        super().setup(first_feature)
+        self.post_input = lambda feature: self.calls.append("post")
+
+
+def test_enhanced_transformer_input_hooks():
+    xformer = CountingTransformer()
+    for _ in range(3):
+        xformer.input(FMEFeature())
+    assert xformer.calls == ["setup", "receive", "receive", "receive"]
+
+    # Overridden hooks must still be called for every feature.
+    xformer = CountingPostInputTransformer()
+    for _ in range(2):
+        xformer.input(FMEFeature())
+    assert xformer.calls == ["setup", "receive", "post", "receive", "post"]
+
+    # So must hooks assigned on the instance.
+    xformer = InstanceHookTransformer()
+    for _ in range(2):
+        xformer.input(FMEFeature())
+    assert xformer.calls == ["setup", "receive", "post", "receive", "post"]
+
+
+def test_enhanced_transformer_freed_without_gc():
+    """Skipping the input hooks mustn't keep the transformer alive in a cycle."""
+    xformer = CountingTransformer()
+    xformer.input(FMEFeature())
+    ref = weakref.ref(xformer)
+    del xformer
+    assert ref() is None
+
+
 def test_constructors_handle_missing_macrovalues(monkeypatch):
     """
     Classes with constructors that access `fme.macroValues` need to handle the case